@@ -9,9 +9,37 @@ import {
   SettingsData,
 } from "@/utilities/settings";
 import { defineWxtStore } from "@/utilities/wxt-store";
+import { toRaw } from "vue";
+import { storage } from "wxt/utils/storage";
 
 export const SETTINGS_KEY = "miniTrainStoreSettings";
 
+// Fingerprint of the content last bulk-exported to Odoo, per product
+// identifier (see exportProducts)
+export const EXPORT_HASHES = storage.defineItem<Record<string, string>>(
+  "local:odooExportHashes",
+  { defaultValue: {} },
+);
+
+function forgetExportHashes(productIdentifiers: string[]) {
+  EXPORT_HASHES.getValue()
+    .then((storedHashes) => {
+      // Copy: the stored value may be the shared default object
+      const hashes = { ...storedHashes };
+      productIdentifiers.forEach((id) => delete hashes[id]);
+      return EXPORT_HASHES.setValue(hashes);
+    })
+    .catch((error) => {
+      console.error("Error forgetting Odoo export fingerprints:", error);
+    });
+}
+
+function clearExportHashes() {
+  EXPORT_HASHES.removeValue().catch((error) => {
+    console.error("Error clearing Odoo export fingerprints:", error);
+  });
+}
+
 export const useSettingsStore = defineWxtStore(SETTINGS_KEY, {
   state: () => DEFAULT_SETTINGS,
   actions: (state) => ({
@@ -20,6 +48,7 @@ export const useSettingsStore = defineWxtStore(SETTINGS_KEY, {
       state.tags = DEFAULT_SETTINGS.tags;
       state.odoo = { ...DEFAULT_SETTINGS.odoo };
       state.profiles = DEFAULT_SETTINGS.profiles;
+      clearExportHashes();
     },
     addProfile(userIdentifier: string, displayName: string) {
       state.profiles[userIdentifier] = {
@@ -57,28 +86,26 @@ export const useSettingsStore = defineWxtStore(SETTINGS_KEY, {
         };
       }
 
-      const existingIdentifier = new Set(
-        Object.keys(state.profiles[userIdentifier].listings),
-      );
-      const newIdentifiers = new Set(Object.keys(listing));
-
-      const added = newIdentifiers.difference(existingIdentifier);
-      const updated = newIdentifiers.intersection(existingIdentifier);
-      const removed = existingIdentifier.difference(newIdentifiers);
       const profile = state.profiles[userIdentifier];
+      let added = 0;
+      let updated = 0;
+      let removed = 0;
 
-      added.forEach((id) => {
-        profile.listings[id] = listing[id];
-      });
-
-      updated.forEach((id) => {
-        profile.listings[id] = listing[id];
+      // Single pass over the scraped listing, counting while storing
+      Object.entries(listing).forEach(([id, product]) => {
+        if (id in profile.listings) {
+          updated++;
+        } else {
+          added++;
+        }
+        profile.listings[id] = product;
       });
 
       if (markMissingAsRemoved) {
-        removed.forEach((id) => {
-          if (profile.listings[id]) {
-            profile.listings[id].state = ProductState.REMOVED;
+        Object.entries(profile.listings).forEach(([id, product]) => {
+          if (!(id in listing)) {
+            product.state = ProductState.REMOVED;
+            removed++;
           }
         });
       }
@@ -86,9 +113,9 @@ export const useSettingsStore = defineWxtStore(SETTINGS_KEY, {
       profile.lastScraped = new Date().toISOString();
 
       return {
-        added: added.size,
-        updated: updated.size,
-        removed: markMissingAsRemoved ? removed.size : 0,
+        added,
+        updated,
+        removed,
       };
     },
     updateProductDetail(productIdentifier: string, detail: ProductDetail) {
@@ -122,6 +149,9 @@ export const useSettingsStore = defineWxtStore(SETTINGS_KEY, {
     },
     clearProfileData(userIdentifier: string) {
       if (state.profiles[userIdentifier]) {
+        forgetExportHashes(
+          Object.keys(state.profiles[userIdentifier].listings),
+        );
         state.profiles[userIdentifier].listings = {};
         state.profiles[userIdentifier].details = {};
         state.profiles[userIdentifier].lastScraped = new Date().toISOString();
@@ -133,11 +163,13 @@ export const useSettingsStore = defineWxtStore(SETTINGS_KEY, {
         ...newSettings.odoo,
       };
       state.profiles = newSettings.profiles;
+      clearExportHashes();
       state.tags = newSettings.tags;
       state.categories = newSettings.categories;
     },
     export(): SettingsData {
-      return JSON.parse(JSON.stringify(state));
+      // Clone the unproxied state directly rather than through a JSON string
+      return structuredClone(toRaw(state));
     },
     addTag(tag: string, pattern: string) {
       state.tags.push({ tag, pattern });
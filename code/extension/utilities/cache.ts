@@ -0,0 +1,26 @@
+// Return the cached value for `key`, computing and storing it on a miss.
+// Keeps at most `maxSize` entries, evicting the least recently used one.
+export function getOrComputeLru<V>(
+  cache: Map<string, V>,
+  key: string,
+  maxSize: number,
+  compute: () => V,
+): V {
+  if (cache.has(key)) {
+    const value = cache.get(key) as V;
+    // Re-insert to mark the entry as the most recently used
+    cache.delete(key);
+    cache.set(key, value);
+    return value;
+  }
+
+  const value = compute();
+
+  const oldestKey = cache.keys().next().value;
+  if (cache.size >= maxSize && oldestKey !== undefined) {
+    cache.delete(oldestKey);
+  }
+
+  cache.set(key, value);
+  return value;
+}
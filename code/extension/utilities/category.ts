@@ -1,29 +1,47 @@
 import { useSettingsStore } from "@/stores/settings";
+import { getOrComputeLru } from "./cache";
 import { CombinedProduct } from "./settings";
 
+// Maximum number of titles whose category is kept in memory
+const CATEGORY_BY_TITLE_MAX_SIZE = 4096;
+
 export const COMPILED_CATEGORIES = computed(() => {
   const settings = useSettingsStore();
 
-  return settings.categories.value.map((cat) => ({
-    ...cat,
-    regex: new RegExp(cat.pattern, "i"),
-  }));
+  return {
+    patterns: settings.categories.value.map((cat) => ({
+      ...cat,
+      regex: new RegExp(cat.pattern, "i"),
+    })),
+    // Category already computed per title, replaced along with the patterns
+    byTitle: new Map<string, string | null>(),
+  };
 });
 
 export function getCategoryForProduct(product: CombinedProduct): string | null {
   const title = product.listing.title;
+  const { patterns, byTitle } = COMPILED_CATEGORIES.value;
+
+  return getOrComputeLru(byTitle, title, CATEGORY_BY_TITLE_MAX_SIZE, () =>
+    matchCategory(patterns, title),
+  );
+}
 
+function matchCategory(
+  patterns: { category: string; regex: RegExp }[],
+  title: string,
+): string | null {
   // Strip 2 first words (e.g., "Train Jouet") to focus on the model name
   const titleWithoutPrefix = title.split(" ").slice(2).join(" ");
 
-  for (const cat of COMPILED_CATEGORIES.value) {
+  for (const cat of patterns) {
     if (cat.regex.test(titleWithoutPrefix)) {
       return cat.category;
     }
   }
 
   // If no match without prefix, try with full title as fallback
-  for (const cat of COMPILED_CATEGORIES.value) {
+  for (const cat of patterns) {
     if (cat.regex.test(title)) {
       return cat.category;
     }
@@ -60,12 +60,14 @@ export function filterAndSortProducts(
   });
 
   if (orderBy === "date") {
-    filtered = filtered.sort((a, b) => {
-      const dateA = new Date(a.listing.date).getTime();
-      const dateB = new Date(b.listing.date).getTime();
+    // Parse each date once up front instead of twice per comparison
+    const timestamps = new Map(
+      filtered.map((p) => [p, new Date(p.listing.date).getTime()]),
+    );
 
-      return dateB - dateA; // Newest first
-    });
+    filtered = filtered.sort(
+      (a, b) => timestamps.get(b)! - timestamps.get(a)!, // Newest first
+    );
   } else if (orderBy === "price") {
     filtered = filtered.sort((a, b) => a.listing.price - b.listing.price); // Lowest price first
   }
@@ -1,16 +1,34 @@
-import { useSettingsStore } from "@/stores/settings";
+import { EXPORT_HASHES, useSettingsStore } from "@/stores/settings";
 import { getCategoryForProduct } from "@/utilities/category";
 import { CombinedProduct, ProductState } from "@/utilities/settings";
 import { getTagsForProduct } from "@/utilities/tag";
 import { z } from "zod";
 import { getWeightFromProduct } from "@/utilities/weight";
 
-// Caches
-const TAGS_ID_CACHE: Map<string, number> = new Map();
-const CATEGORY_ID_CACHE: Map<string, number> = new Map();
-const PUBLIC_CATEGORY_ID_CACHE: Map<string, number> = new Map();
-const TAX_ID_CACHE: Map<string, number> = new Map();
+// Caches (hold the pending lookup so concurrent exports share one request)
+const TAGS_ID_CACHE: Map<string, Promise<number>> = new Map();
+const CATEGORY_ID_CACHE: Map<string, Promise<number>> = new Map();
+const PUBLIC_CATEGORY_ID_CACHE: Map<string, Promise<number | null>> = new Map();
+const TAX_ID_CACHE: Map<string, Promise<number>> = new Map();
+// ID caches already filled with their whole Odoo table
+const PRELOADED_CACHES: Set<Map<string, Promise<number | null>>> = new Set();
+// Odoo instance the ID caches above were filled from
+let CACHES_ODOO_URL: string | null = null;
 const DEFAULT_IMAGE_VERTICAL_CROP_RATIO = 0.06;
+// Lossy encode quality for cropped photos (uploaded as Odoo's largest size)
+const IMAGE_ENCODE_QUALITY = 0.9;
+// Maximum number of products exported to Odoo at the same time
+const EXPORT_CONCURRENCY = 4;
+// Maximum number of products sent in a single create call
+const CREATE_BATCH_SIZE = 10;
+// Maximum JSON size of a single create call, images included, to stay well
+// below the request size Odoo accepts
+const CREATE_BATCH_MAX_BYTES = 8 * 1024 * 1024;
+// Allowance for the non-image fields of a product when estimating its size
+const PRODUCT_FIELDS_BYTES = 4 * 1024;
+// Maximum number of photos downloaded (and decoded) at the same time, across
+// every product being exported
+const PHOTO_DOWNLOAD_CONCURRENCY = 8;
 
 export enum OdooProductState {
   NOT_FOUND = "not_found",
@@ -43,6 +61,7 @@ export interface OdooBulkExportResult {
   success: boolean;
   created: number;
   updated: number;
+  skipped: number; // unchanged since the last export, not written again
   archived: number;
   errors: Array<{ productId: string; error: string }>;
 }
@@ -87,6 +106,11 @@ export const SearchResponseSchema = z.array(
   }),
 );
 
+// `create` answers with the new IDs, either bare or as records
+const CreateResponseSchema = z.array(
+  z.union([z.number(), z.object({ id: z.number() })]),
+);
+
 export interface ProductTemplateRequest {
   name: string;
   list_price: number;
@@ -107,6 +131,10 @@ export interface ProductTemplateRequest {
   product_template_image_ids?: [number, number, unknown][];
 }
 
+// Odoo answered with an error status: the request's transaction was rolled
+// back, so nothing it asked for was applied
+class OdooHttpError extends Error {}
+
 async function requestOdoo(
   model: string,
   method: string,
@@ -130,7 +158,7 @@ async function requestOdoo(
 
   if (!response.ok) {
     const errorText = await response.text();
-    throw new Error(
+    throw new OdooHttpError(
       `Odoo API error ${response.status}: ${errorText || response.statusText}`,
     );
   }
@@ -138,6 +166,103 @@ async function requestOdoo(
   return await response.json();
 }
 
+// Run `worker` over `items` with at most `limit` calls in flight, keeping order
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  worker: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+
+  const runners = Array.from(
+    { length: Math.min(limit, items.length) },
+    async () => {
+      while (nextIndex < items.length) {
+        const index = nextIndex++;
+        results[index] = await worker(items[index], index);
+      }
+    },
+  );
+
+  await Promise.all(runners);
+  return results;
+}
+
+// Drop every cached ID when the configured Odoo instance changed, since IDs
+// are only meaningful on the instance they were read from
+function resetCachesOnOdooUrlChange(): string {
+  const settings = useSettingsStore();
+  const odooUrl = settings.odoo.value.url;
+
+  if (CACHES_ODOO_URL !== odooUrl) {
+    TAGS_ID_CACHE.clear();
+    CATEGORY_ID_CACHE.clear();
+    PUBLIC_CATEGORY_ID_CACHE.clear();
+    TAX_ID_CACHE.clear();
+    PRELOADED_CACHES.clear();
+    CACHES_ODOO_URL = odooUrl;
+  }
+
+  return odooUrl;
+}
+
+// Wrap tasks so that at most `limit` of them run at the same time, across
+// every caller sharing the returned function
+function createLimiter(limit: number) {
+  let active = 0;
+  const waiting: Array<() => void> = [];
+
+  return async <R>(task: () => Promise<R>): Promise<R> => {
+    if (active < limit) {
+      active++;
+    } else {
+      // Wait for a finishing task to hand its slot over
+      await new Promise<void>((resolve) => waiting.push(resolve));
+    }
+
+    try {
+      return await task();
+    } finally {
+      const next = waiting.shift();
+      if (next) {
+        next();
+      } else {
+        active--;
+      }
+    }
+  };
+}
+
+const limitPhotoDownload = createLimiter(PHOTO_DOWNLOAD_CONCURRENCY);
+
+// Return the cached lookup for `key`, or start it; failed and empty lookups
+// are evicted so they are retried on the next call
+function getCachedId<T extends number | null>(
+  cache: Map<string, Promise<T>>,
+  key: string,
+  fetchId: () => Promise<T>,
+): Promise<T> {
+  resetCachesOnOdooUrlChange();
+
+  const cached = cache.get(key);
+  if (cached !== undefined) return cached;
+
+  const pending = fetchId().then(
+    (id) => {
+      if (id === null) cache.delete(key);
+      return id;
+    },
+    (error) => {
+      cache.delete(key);
+      throw error;
+    },
+  );
+
+  cache.set(key, pending);
+  return pending;
+}
+
 function stringToHtml(str: string): string {
   str = str.replace("\\n", "<br/>").replace(/\n/g, "<br/>");
   return str;
@@ -454,6 +579,39 @@ async function searchProduct(product: CombinedProduct): Promise<number | null> {
   }
 }
 
+// Search for products by identifier, in a single request
+async function searchProducts(
+  products: CombinedProduct[],
+): Promise<Map<string, number>> {
+  const ResponseSchema = z.array(
+    z.object({
+      id: z.number(),
+      default_code: z.union([z.string(), z.boolean()]),
+    }),
+  );
+
+  const response = await requestOdoo("product.template", "search_read", {
+    fields: ["default_code"],
+    domain: [
+      ["default_code", "in", products.map((product) => product.identifier)],
+    ],
+  });
+
+  const records = ResponseSchema.parse(response);
+  const productIds = new Map<string, number>();
+
+  records.forEach((record) => {
+    if (
+      typeof record.default_code === "string" &&
+      !productIds.has(record.default_code)
+    ) {
+      productIds.set(record.default_code, record.id);
+    }
+  });
+
+  return productIds;
+}
+
 // Archive product
 async function archiveProducts(productIds: number[]): Promise<void> {
   await requestOdoo("product.template", "action_archive", {
@@ -465,104 +623,134 @@ async function archiveProducts(productIds: number[]): Promise<void> {
 }
 
 // Get or fetch category ID
-async function getCategoryId(categoryName: string): Promise<number> {
-  const cached = CATEGORY_ID_CACHE.get(categoryName);
-  if (cached !== undefined) return cached;
-
-  const response = await requestOdoo("product.category", "search_read", {
-    fields: ["display_name"],
-    domain: [["display_name", "=", categoryName]],
-  });
+function getCategoryId(categoryName: string): Promise<number> {
+  return getCachedId(CATEGORY_ID_CACHE, categoryName, async () => {
+    const response = await requestOdoo("product.category", "search_read", {
+      fields: ["display_name"],
+      domain: [["display_name", "=", categoryName]],
+    });
 
-  const records = SearchResponseSchema.parse(response);
+    const records = SearchResponseSchema.parse(response);
 
-  if (!records || records.length === 0) {
-    throw new Error(`Category '${categoryName}' not found in Odoo.`);
-  }
+    if (!records || records.length === 0) {
+      throw new Error(`Category '${categoryName}' not found in Odoo.`);
+    }
 
-  const id = records[0].id;
-  CATEGORY_ID_CACHE.set(categoryName, id);
-  return id;
+    return records[0].id;
+  });
 }
 
 // Get or fetch public category ID
-async function getPublicCategoryId(
-  categoryName: string,
-): Promise<number | null> {
-  const cached = PUBLIC_CATEGORY_ID_CACHE.get(categoryName);
-  if (cached !== undefined) return cached;
-
-  const response = await requestOdoo("product.public.category", "search_read", {
-    fields: ["display_name"],
-    domain: [["display_name", "=", categoryName]],
-  });
+function getPublicCategoryId(categoryName: string): Promise<number | null> {
+  return getCachedId(PUBLIC_CATEGORY_ID_CACHE, categoryName, async () => {
+    const response = await requestOdoo(
+      "product.public.category",
+      "search_read",
+      {
+        fields: ["display_name"],
+        domain: [["display_name", "=", categoryName]],
+      },
+    );
 
-  const records = SearchResponseSchema.parse(response);
+    const records = SearchResponseSchema.parse(response);
 
-  if (!records || records.length === 0) {
-    console.warn(`Public Category '${categoryName}' not found in Odoo.`);
-    return null;
-  }
+    if (!records || records.length === 0) {
+      console.warn(`Public Category '${categoryName}' not found in Odoo.`);
+      return null;
+    }
 
-  const id = records[0].id;
-  PUBLIC_CATEGORY_ID_CACHE.set(categoryName, id);
-  return id;
+    return records[0].id;
+  });
 }
 
 // Get or fetch tag ID
-async function getTagId(tagName: string): Promise<number> {
-  const cached = TAGS_ID_CACHE.get(tagName);
-  if (cached !== undefined) return cached;
-
-  const response = await requestOdoo("product.tag", "search_read", {
-    fields: ["display_name"],
-    domain: [["display_name", "=", tagName]],
-  });
+function getTagId(tagName: string): Promise<number> {
+  return getCachedId(TAGS_ID_CACHE, tagName, async () => {
+    const response = await requestOdoo("product.tag", "search_read", {
+      fields: ["display_name"],
+      domain: [["display_name", "=", tagName]],
+    });
 
-  const records = SearchResponseSchema.parse(response);
+    const records = SearchResponseSchema.parse(response);
 
-  if (!records || records.length === 0) {
-    throw new Error(`Tag '${tagName}' not found in Odoo.`);
-  }
+    if (!records || records.length === 0) {
+      throw new Error(`Tag '${tagName}' not found in Odoo.`);
+    }
 
-  const id = records[0].id;
-  TAGS_ID_CACHE.set(tagName, id);
-  return id;
+    return records[0].id;
+  });
 }
 
 // Get or fetch tax ID
-async function getTaxId(): Promise<number> {
+function getTaxId(): Promise<number> {
   const taxName = "0% EXEMPT G";
-  const cached = TAX_ID_CACHE.get(taxName);
-  if (cached !== undefined) return cached;
 
-  const response = await requestOdoo("account.tax", "search_read", {
-    fields: ["display_name"],
-    domain: [["display_name", "=", taxName]],
+  return getCachedId(TAX_ID_CACHE, taxName, async () => {
+    const response = await requestOdoo("account.tax", "search_read", {
+      fields: ["display_name"],
+      domain: [["display_name", "=", taxName]],
+    });
+
+    const records = SearchResponseSchema.parse(response);
+
+    if (!records || records.length === 0) {
+      throw new Error(`Tax '${taxName}' not found in Odoo.`);
+    }
+
+    return records[0].id;
   });
+}
 
-  const records = SearchResponseSchema.parse(response);
+// Fill the ID caches with one request per model, so that bulk exports resolve
+// tags and categories without a round trip per product. Tables already
+// preloaded are not fetched again; names missing from them still fall back
+// to a lookup of their own.
+async function preloadReferenceIds(): Promise<void> {
+  const odooUrl = resetCachesOnOdooUrlChange();
+
+  const preload = async (
+    cache: Map<string, Promise<number | null>>,
+    getOptions: () => Promise<OdooReferenceOption[]>,
+  ) => {
+    if (PRELOADED_CACHES.has(cache)) return;
+
+    const options = await getOptions();
+    // The instance changed while loading: these IDs belong to the old one
+    if (CACHES_ODOO_URL !== odooUrl) return;
+
+    options.forEach((option) => {
+      if (!cache.has(option.name)) {
+        cache.set(option.name, Promise.resolve(option.id));
+      }
+    });
 
-  if (!records || records.length === 0) {
-    throw new Error(`Tax '${taxName}' not found in Odoo.`);
-  }
+    PRELOADED_CACHES.add(cache);
+  };
 
-  const id = records[0].id;
-  TAX_ID_CACHE.set(taxName, id);
-  return id;
+  await Promise.all([
+    preload(CATEGORY_ID_CACHE, getAvailableCategories),
+    preload(PUBLIC_CATEGORY_ID_CACHE, getAvailablePublicCategories),
+    preload(TAGS_ID_CACHE, getAvailableTags),
+    getTaxId(),
+  ]);
 }
 
 async function cropImageVertically(
   blob: Blob,
   cropRatio: number,
 ): Promise<Blob> {
+  const normalizedCropRatio = Number.isFinite(cropRatio)
+    ? Math.min(Math.max(cropRatio, 0), 0.49)
+    : DEFAULT_IMAGE_VERTICAL_CROP_RATIO;
+
+  // Nothing to crop: skip decoding and re-encoding the image entirely
+  if (normalizedCropRatio === 0) {
+    return blob;
+  }
+
   const imageBitmap = await createImageBitmap(blob);
 
   try {
-    const normalizedCropRatio = Number.isFinite(cropRatio)
-      ? Math.min(Math.max(cropRatio, 0), 0.49)
-      : DEFAULT_IMAGE_VERTICAL_CROP_RATIO;
-
     const cropOffset = Math.floor(imageBitmap.height * normalizedCropRatio);
     const croppedHeight = imageBitmap.height - cropOffset * 2;
 
@@ -592,7 +780,7 @@ async function cropImageVertically(
     );
 
     const croppedBlob = await new Promise<Blob | null>((resolve) => {
-      canvas.toBlob(resolve, blob.type || "image/jpeg");
+      canvas.toBlob(resolve, blob.type || "image/jpeg", IMAGE_ENCODE_QUALITY);
     });
 
     if (!croppedBlob) {
@@ -625,10 +813,9 @@ export async function downloadAndCropImageAsBase64(
   return new Promise((resolve, reject) => {
     const reader = new FileReader();
     reader.onloadend = () => {
-      const base64 = reader.result as string;
-      // Remove the data URL prefix
-      const base64Data = base64.split(",")[1];
-      resolve(base64Data);
+      const dataUrl = reader.result as string;
+      // Remove the data URL prefix without splitting (and copying) the payload
+      resolve(dataUrl.slice(dataUrl.indexOf(",") + 1));
     };
     reader.onerror = reject;
     reader.readAsDataURL(croppedBlob);
@@ -639,50 +826,66 @@ function getLargePhotoUrl(url: string | null): string {
   if (!url) return "";
   // Convert thumbnail URLs to full-size
   return url
-    .replace(/ad-thumb/g, "ad-large")
-    .replace(/ad-small/g, "ad-large")
-    .replace(/w=256/g, "w=1200");
+    .replaceAll("ad-thumb", "ad-large")
+    .replaceAll("ad-small", "ad-large")
+    .replaceAll("w=256", "w=1200");
+}
+
+interface LoadedImages {
+  firstImage: string | null;
+  additionalImages: string[];
+  complete: boolean; // false when at least one photo failed to load
 }
 
 // Load images — downloads all photos for a product
-async function loadImages(
-  product: CombinedProduct,
-): Promise<{ firstImage: string | null; additionalImages: string[] }> {
+async function loadImages(product: CombinedProduct): Promise<LoadedImages> {
   let firstImage: string | null = null;
   const additionalImages: string[] = [];
 
   if (!product.detail?.photos || product.detail.photos.length === 0) {
-    return { firstImage, additionalImages };
+    return { firstImage, additionalImages, complete: true };
   }
 
-  // Download first image as base64 for the main product image (image_1920)
-  try {
-    firstImage = await downloadAndCropImageAsBase64(
-      getLargePhotoUrl(product.detail.photos[0]),
-    );
-  } catch (error) {
-    console.error("Error downloading first image:", error);
-  }
+  // Download and crop the photos concurrently; each one is independent and
+  // the image decode runs off the main thread. The limiter is shared by all
+  // products, so concurrent exports don't multiply the number in flight.
+  const images = await Promise.all(
+    product.detail.photos.map((photo, i) =>
+      limitPhotoDownload(async () => {
+        try {
+          return await downloadAndCropImageAsBase64(getLargePhotoUrl(photo));
+        } catch (error) {
+          if (i === 0) {
+            console.error("Error downloading first image:", error);
+          } else {
+            console.error(`Error downloading image ${i}:`, error);
+          }
+          return null;
+        }
+      }),
+    ),
+  );
 
-  // Download remaining images for product.image gallery records
-  for (let i = 1; i < product.detail.photos.length; i++) {
-    try {
-      const imageData = await downloadAndCropImageAsBase64(
-        getLargePhotoUrl(product.detail.photos[i]),
-      );
+  // First image is the main product image (image_1920), the remaining ones
+  // become product.image gallery records
+  firstImage = images[0];
+  images.slice(1).forEach((imageData) => {
+    if (imageData !== null) {
       additionalImages.push(imageData);
-    } catch (error) {
-      console.error(`Error downloading image ${i}:`, error);
     }
-  }
+  });
 
-  return { firstImage, additionalImages };
+  return {
+    firstImage,
+    additionalImages,
+    complete: images.every((imageData) => imageData !== null),
+  };
 }
 
-// Convert product to Odoo data format
+// Convert product to Odoo data format, telling whether every photo made it in
 async function productToOdooDict(
   product: CombinedProduct,
-): Promise<ProductTemplateRequest> {
+): Promise<{ productData: ProductTemplateRequest; imagesComplete: boolean }> {
   const tags = getTagsForProduct(product);
   const tagsIds = await Promise.all(tags.map((tag) => getTagId(tag)));
   const category = getCategoryForProduct(product);
@@ -693,7 +896,11 @@ async function productToOdooDict(
   const descriptionHtml = stringToHtml(descriptionWithLink);
   const extractedWeight = getWeightFromProduct(product);
 
-  const { firstImage, additionalImages } = await loadImages(product);
+  const {
+    firstImage,
+    additionalImages,
+    complete: imagesComplete,
+  } = await loadImages(product);
 
   // Odoo expects UTC datetime in format: YYYY-MM-DD HH:MM:SS
   const createdDate = new Date(product.listing.date)
@@ -755,31 +962,90 @@ async function productToOdooDict(
     }
   }
 
-  return productData;
+  return { productData, imagesComplete };
 }
 
-// Create product in Odoo
-async function createProduct(product: CombinedProduct): Promise<number> {
-  const productData = await productToOdooDict(product);
+// Fingerprint everything the Odoo payload is derived from, so unchanged
+// products can skip the write (and its image downloads) on the next export
+async function getExportHash(product: CombinedProduct): Promise<string> {
+  const settings = useSettingsStore();
+
+  const content = JSON.stringify([
+    settings.odoo.value.url,
+    product.listing.title,
+    product.listing.price,
+    product.listing.date,
+    product.detail?.description || "",
+    product.detail?.photos || [],
+    getTagsForProduct(product),
+    getCategoryForProduct(product),
+    settings.odoo.value.imageVerticalCropRatio,
+  ]);
+
+  const digest = await crypto.subtle.digest(
+    "SHA-256",
+    new TextEncoder().encode(content),
+  );
+
+  return Array.from(new Uint8Array(digest), (byte) =>
+    byte.toString(16).padStart(2, "0"),
+  ).join("");
+}
+
+// Merge fingerprint changes (null drops one) into a fresh read of the stored
+// fingerprints, so that clears made while an export runs are not undone
+async function saveExportHashes(
+  changes: Record<string, string | null>,
+): Promise<void> {
+  if (Object.keys(changes).length === 0) return;
+
+  const hashes = { ...(await EXPORT_HASHES.getValue()) };
+  Object.entries(changes).forEach(([identifier, hash]) => {
+    if (hash === null) {
+      delete hashes[identifier];
+    } else {
+      hashes[identifier] = hash;
+    }
+  });
+
+  await EXPORT_HASHES.setValue(hashes);
+}
 
+// Create products in Odoo, returning their IDs in the same order
+async function createProducts(
+  productsData: ProductTemplateRequest[],
+): Promise<number[]> {
   const response = await requestOdoo("product.template", "create", {
-    vals_list: [productData],
+    vals_list: productsData,
   });
 
-  const productIds = SearchResponseSchema.parse(response);
+  const productIds = CreateResponseSchema.parse(response).map((record) =>
+    typeof record === "number" ? record : record.id,
+  );
+
+  if (productIds.length !== productsData.length) {
+    throw new Error("Unexpected create response format from Odoo");
+  }
+
+  console.log(`Product(s) created with IDs: ${productIds.join(", ")}`);
 
-  const productId = Array.isArray(productIds) ? productIds[0] : productIds;
-  console.log(`Product created with ID: ${productId}`);
+  return productIds;
+}
+
+// Create product in Odoo
+async function createProduct(product: CombinedProduct): Promise<number> {
+  const { productData } = await productToOdooDict(product);
 
-  return productId.id;
+  const [productId] = await createProducts([productData]);
+  return productId;
 }
 
-// Update product in Odoo
+// Update product in Odoo, returning whether every photo was sent
 async function updateProduct(
   productId: number,
   product: CombinedProduct,
-): Promise<void> {
-  const productData = await productToOdooDict(product);
+): Promise<boolean> {
+  const { productData, imagesComplete } = await productToOdooDict(product);
 
   await requestOdoo("product.template", "write", {
     ids: [productId],
@@ -787,6 +1053,39 @@ async function updateProduct(
   });
 
   console.log(`Product updated with ID: ${productId}`);
+
+  return imagesComplete;
+}
+
+// Approximate JSON size of a product payload from its base64 images and
+// description, without serializing it
+function estimatePayloadSize(productData: ProductTemplateRequest): number {
+  let size =
+    PRODUCT_FIELDS_BYTES +
+    productData.description_ecommerce.length +
+    (productData.image_1920?.length || 0);
+
+  productData.product_template_image_ids?.forEach(([, , values]) => {
+    if (
+      typeof values === "object" &&
+      values !== null &&
+      "image_1920" in values &&
+      typeof values.image_1920 === "string"
+    ) {
+      size += values.image_1920.length;
+    }
+  });
+
+  return size;
+}
+
+// Sold or removed listings must not be (or stay) published
+function isListingUnavailable(product: CombinedProduct): boolean {
+  return (
+    product.listing.state === ProductState.PURCHASE_PENDING ||
+    product.listing.state === ProductState.PURCHASE_COMPLETED ||
+    product.listing.state === ProductState.REMOVED
+  );
 }
 
 // Export single product
@@ -804,11 +1103,7 @@ export async function exportProduct(
     );
 
     if (existingProductId === null) {
-      if (
-        product.listing.state === ProductState.PURCHASE_PENDING ||
-        product.listing.state === ProductState.PURCHASE_COMPLETED ||
-        product.listing.state === ProductState.REMOVED
-      ) {
+      if (isListingUnavailable(product)) {
         // Don't create new product if it's already sold or removed
         return {
           success: true,
@@ -825,11 +1120,7 @@ export async function exportProduct(
       };
     } else {
       // Product exists
-      if (
-        product.listing.state === ProductState.PURCHASE_PENDING ||
-        product.listing.state === ProductState.PURCHASE_COMPLETED ||
-        product.listing.state === ProductState.REMOVED
-      ) {
+      if (isListingUnavailable(product)) {
         // Archive the product
         await archiveProducts([existingProductId]);
         return {
@@ -869,25 +1160,186 @@ export async function exportProducts(
 ): Promise<OdooBulkExportResult> {
   let created = 0;
   let updated = 0;
+  let skipped = 0;
   let archived = 0;
   const errors: Array<{ productId: string; error: string }> = [];
 
-  for (const product of products) {
-    const result = await exportProduct(product, overwriteExisting);
+  if (products.length === 0) {
+    return { success: true, created, updated, skipped, archived, errors };
+  }
+
+  const addErrors = (failed: CombinedProduct[], error: unknown) => {
+    failed.forEach((product) => {
+      console.error(`Error exporting product ${product.listing.title}:`, error);
+      errors.push({ productId: product.identifier, error: String(error) });
+    });
+  };
+
+  // Look every product up at once, then sort them by the action they need
+  let existingProductIds: Map<string, number>;
+  try {
+    existingProductIds = await searchProducts(products);
+  } catch (error) {
+    addErrors(products, error);
+    return { success: false, created, updated, skipped, archived, errors };
+  }
+
+  const toCreate: CombinedProduct[] = [];
+  const toUpdate: Array<{ productId: number; product: CombinedProduct }> = [];
+  const toArchive: Array<{ productId: number; product: CombinedProduct }> = [];
+
+  products.forEach((product) => {
+    const productId = existingProductIds.get(product.identifier);
+
+    if (productId === undefined) {
+      // Don't create new product if it's already sold or removed
+      if (!isListingUnavailable(product)) toCreate.push(product);
+    } else if (isListingUnavailable(product)) {
+      toArchive.push({ productId, product });
+    } else if (overwriteExisting) {
+      toUpdate.push({ productId, product });
+    }
+  });
+
+  // Only creations and updates need tag, category and tax IDs
+  if (toCreate.length > 0 || toUpdate.length > 0) {
+    try {
+      await preloadReferenceIds();
+    } catch (error) {
+      // Lookups fall back to one request per missing name
+      console.warn("Could not preload Odoo reference IDs:", error);
+    }
+  }
+
+  // Copy: the stored value may be the shared default object
+  const exportHashes = { ...(await EXPORT_HASHES.getValue()) };
+  const createdHashes: Record<string, string | null> = {};
+  const updatedHashes: Record<string, string | null> = {};
+
+  const saveHashes = async (changes: Record<string, string | null>) => {
+    try {
+      await saveExportHashes(changes);
+    } catch (error) {
+      console.error("Could not save Odoo export fingerprints:", error);
+    }
+  };
+
+  // Archive everything in one call
+  if (toArchive.length > 0) {
+    try {
+      await archiveProducts(toArchive.map(({ productId }) => productId));
+      archived = toArchive.length;
+    } catch (error) {
+      addErrors(toArchive.map(({ product }) => product), error);
+    }
+  }
+
+  type PendingCreate = {
+    product: CombinedProduct;
+    productData: ProductTemplateRequest;
+    imagesComplete: boolean;
+  };
+
+  const createPending = async (entries: PendingCreate[]): Promise<void> => {
+    if (entries.length === 0) return;
+
+    try {
+      await createProducts(entries.map(({ productData }) => productData));
+    } catch (error) {
+      // Only an error status guarantees the create was rolled back: retry
+      // the products one by one so that only the faulty ones fail. Any other
+      // failure (network, unexpected response) may come after Odoo created
+      // them, so resending could publish duplicates.
+      if (error instanceof OdooHttpError && entries.length > 1) {
+        for (const entry of entries) {
+          await createPending([entry]);
+        }
+      } else {
+        addErrors(entries.map(({ product }) => product), error);
+      }
+      return;
+    }
+
+    created += entries.length;
+
+    // A product missing photos is left unfingerprinted so the next export
+    // sends it again
+    for (const { product, imagesComplete } of entries) {
+      if (imagesComplete) {
+        createdHashes[product.identifier] = await getExportHash(product);
+      }
+    }
+  };
+
+  // Build the payloads (image downloads included) a few at a time and send
+  // them in batches bounded by count and by estimated JSON size
+  let pending: PendingCreate[] = [];
+  let pendingBytes = 0;
+
+  for (let start = 0; start < toCreate.length; start += EXPORT_CONCURRENCY) {
+    const built = await mapWithConcurrency(
+      toCreate.slice(start, start + EXPORT_CONCURRENCY),
+      EXPORT_CONCURRENCY,
+      async (product): Promise<PendingCreate | null> => {
+        try {
+          return { product, ...(await productToOdooDict(product)) };
+        } catch (error) {
+          addErrors([product], error);
+          return null;
+        }
+      },
+    );
+
+    for (const entry of built) {
+      if (entry === null) continue;
+
+      const size = estimatePayloadSize(entry.productData);
+      if (
+        pending.length >= CREATE_BATCH_SIZE ||
+        (pending.length > 0 && pendingBytes + size > CREATE_BATCH_MAX_BYTES)
+      ) {
+        await createPending(pending);
+        pending = [];
+        pendingBytes = 0;
+      }
 
-    if (result.success) {
-      if (result.created) created++;
-      if (result.updated) updated++;
-      if (result.archived) archived++;
-    } else if (result.error) {
-      errors.push({ productId: product.identifier, error: result.error });
+      pending.push(entry);
+      pendingBytes += size;
     }
   }
 
+  await createPending(pending);
+  await saveHashes(createdHashes);
+
+  // `write` applies the same values to every ID, so updates stay per product
+  await mapWithConcurrency(
+    toUpdate,
+    EXPORT_CONCURRENCY,
+    async ({ productId, product }) => {
+      try {
+        const exportHash = await getExportHash(product);
+        if (exportHashes[product.identifier] === exportHash) {
+          // Nothing changed since the last export
+          skipped++;
+          return;
+        }
+
+        const imagesComplete = await updateProduct(productId, product);
+        updatedHashes[product.identifier] = imagesComplete ? exportHash : null;
+        updated++;
+      } catch (error) {
+        addErrors([product], error);
+      }
+    },
+  );
+
+  await saveHashes(updatedHashes);
+
   return {
     success: errors.length === 0,
     created,
     updated,
+    skipped,
     archived,
     errors,
   };
@@ -1,5 +1,7 @@
 import { ProductDetail } from "../settings";
 
+const GALLERY_BUTTON_REGEX = /Voir les.*photos?/i;
+
 export function extractUsernameFromProductPage(): string | null {
   // Try to find the seller profile link
   const PROFILE_LINK_SELECTOR = 'a[href^="/profile/"]';
@@ -20,7 +22,7 @@ export async function getPhotoUrls(): Promise<string[]> {
   // Look for gallery button and try to click it to get all photos
   const galleryButtons = Array.from(document.querySelectorAll("button"));
   const galleryButton = galleryButtons.find((btn) =>
-    /Voir les.*photos?/i.test(btn.textContent || ""),
+    GALLERY_BUTTON_REGEX.test(btn.textContent || ""),
   );
 
   console.log(`Gallery button ${galleryButton ? "found" : "not found"}`);
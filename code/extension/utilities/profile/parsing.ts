@@ -12,6 +12,19 @@ import {
   TITLE_SELECTOR,
 } from "./selectors";
 
+const NON_DIGITS_REGEX = /\D+/g;
+
+// Relative dates shown for the past week, with their weekday (0 is Sunday)
+const LAST_WEEKDAYS: [string, number][] = [
+  ["dimanche dernier", 0],
+  ["lundi dernier", 1],
+  ["mardi dernier", 2],
+  ["mercredi dernier", 3],
+  ["jeudi dernier", 4],
+  ["vendredi dernier", 5],
+  ["samedi dernier", 6],
+];
+
 export function parseProfileName(): string | null {
   // Try multiple selectors for the profile name
   const selectors = [
@@ -40,35 +53,29 @@ function getLastWeekdayDate(weekday: number): string {
 }
 
 function parseDate(dateStr: string): string {
-  if (dateStr.toLocaleLowerCase().includes("aujourd’hui")) {
+  const lowerDateStr = dateStr.toLocaleLowerCase();
+
+  if (lowerDateStr.includes("aujourd’hui")) {
     return new Date().toISOString();
-  } else if (dateStr.toLocaleLowerCase().includes("hier")) {
+  } else if (lowerDateStr.includes("hier")) {
     const yesterday = new Date();
     yesterday.setDate(yesterday.getDate() - 1);
     return yesterday.toISOString();
-  } else if (dateStr.toLocaleLowerCase().includes("samedi dernier")) {
-    return getLastWeekdayDate(6); // 6 represents Saturday
-  } else if (dateStr.toLocaleLowerCase().includes("vendredi dernier")) {
-    return getLastWeekdayDate(5); // 5 represents Friday
-  } else if (dateStr.toLocaleLowerCase().includes("jeudi dernier")) {
-    return getLastWeekdayDate(4); // 4 represents Thursday
-  } else if (dateStr.toLocaleLowerCase().includes("mercredi dernier")) {
-    return getLastWeekdayDate(3); // 3 represents Wednesday
-  } else if (dateStr.toLocaleLowerCase().includes("mardi dernier")) {
-    return getLastWeekdayDate(2); // 2 represents Tuesday
-  } else if (dateStr.toLocaleLowerCase().includes("lundi dernier")) {
-    return getLastWeekdayDate(1); // 1 represents Monday
-  } else if (dateStr.toLocaleLowerCase().includes("dimanche dernier")) {
-    return getLastWeekdayDate(0); // 0 represents Sunday
-  } else {
-    // Should be in 02/01/2023 format, try parsing it
-    const parts = dateStr.split("/").map((part) => parseInt(part, 10));
-    if (parts.length === 3) {
-      const [day, month, year] = parts;
-      const date = new Date(year, month - 1, day);
-      if (!isNaN(date.getTime())) {
-        return date.toISOString();
-      }
+  }
+
+  for (const [label, weekday] of LAST_WEEKDAYS) {
+    if (lowerDateStr.includes(label)) {
+      return getLastWeekdayDate(weekday);
+    }
+  }
+
+  // Should be in 02/01/2023 format, try parsing it
+  const parts = dateStr.split("/").map((part) => parseInt(part, 10));
+  if (parts.length === 3) {
+    const [day, month, year] = parts;
+    const date = new Date(year, month - 1, day);
+    if (!isNaN(date.getTime())) {
+      return date.toISOString();
     }
   }
 
@@ -101,7 +108,7 @@ export function parseProduct(article: Element): {
     // Get the price
     const priceElem = article.querySelector(PRICE_SELECTOR);
     const priceText = priceElem?.textContent?.trim() || "0";
-    const price = parseFloat(priceText.replace(/[^\d]/g, ""));
+    const price = parseFloat(priceText.replace(NON_DIGITS_REGEX, ""));
 
     // Get the thumbnail image
     const thumbnailElem = article.querySelector(
@@ -1,24 +1,33 @@
 import { useSettingsStore } from "@/stores/settings";
+import { getOrComputeLru } from "./cache";
 import { CombinedProduct } from "./settings";
 
+// Maximum number of titles whose tags are kept in memory
+const TAGS_BY_TITLE_MAX_SIZE = 4096;
+
 export const COMPILED_TAGS = computed(() => {
   const settings = useSettingsStore();
 
-  return settings.tags.value.map((tag) => ({
-    ...tag,
-    regex: new RegExp(tag.pattern, "i"),
-  }));
+  return {
+    patterns: settings.tags.value.map((tag) => ({
+      ...tag,
+      regex: new RegExp(tag.pattern, "i"),
+    })),
+    // Tags already computed per title, replaced along with the patterns
+    byTitle: new Map<string, readonly string[]>(),
+  };
 });
 
 export function getTagsForProduct(product: CombinedProduct): string[] {
-  const tags: string[] = [];
   const title = product.listing.title;
+  const { patterns, byTitle } = COMPILED_TAGS.value;
 
-  COMPILED_TAGS.value.forEach((tag) => {
-    if (tag.regex.test(title)) {
-      tags.push(tag.tag);
-    }
-  });
+  const tags = getOrComputeLru(byTitle, title, TAGS_BY_TITLE_MAX_SIZE, () =>
+    Object.freeze(
+      patterns.filter((tag) => tag.regex.test(title)).map((tag) => tag.tag),
+    ),
+  );
 
-  return tags;
+  // Callers get their own copy so the cached entry cannot be altered
+  return [...tags];
 }
@@ -1,4 +1,4 @@
-import { reactive, watch, toRefs } from "vue";
+import { reactive, watch, toRaw, toRefs } from "vue";
 import { storage } from "@wxt-dev/storage";
 
 let debounceTimeout: ReturnType<typeof setTimeout> | null = null; // Debounce timer
@@ -57,7 +57,9 @@ export function defineWxtStore<
           clearTimeout(debounceTimeout); // Clear the previous debounce timer
         }
         debounceTimeout = setTimeout(() => {
-          storage.setItem(storageKey, JSON.parse(JSON.stringify(newValue)));
+          // Vue stores raw values behind the proxy, so the unwrapped state can
+          // be handed to storage as-is instead of a JSON round trip copy.
+          storage.setItem(storageKey, toRaw(newValue));
           console.log(
             `📤 [${key}] Saved: Change detected in this context after debounce.`,
           );